@@ -10,6 +10,11 @@ Configuration:
     - Environment variable: export DX_API_URL="https://your-server/api/dx.json"
     - Command line: dx --url https://your-server/api/dx.json
 
+    ASCII symbols instead of emoji:
+    - Used automatically when the terminal encoding cannot show emoji
+    - Environment variable: export DX_ASCII=1 (DX_ASCII=0 leaves it automatic)
+    - Command line: dx --ascii
+
 Usage:
     dx              # Show all bands (global)
     dx 10m          # Show specific band
@@ -53,12 +58,13 @@ Version: 1.0 - Dec 7, 2025
 """
 
 import sys
-import argparse
 import time
-import urllib.request
-import urllib.error
-import json
-from datetime import datetime
+import types
+
+# urllib and json are imported where they are used, so that
+# --help, --version and argument errors don't pay for loading them.
+# argparse is only imported by build_parser(), for command lines that
+# parse_args_fast() doesn't handle.
 
 # ============================================================================
 # Configuration
@@ -78,6 +84,7 @@ DXMAP_URL = "https://dxmap.hb9vqq.ch/data"
 # Band display order (highest frequency first)
 # Bands not in this list will be appended at the end
 BAND_ORDER = ["10m", "12m", "15m", "17m", "20m", "30m", "40m", "60m", "80m", "160m"]
+BAND_RANK = {band: i for i, band in enumerate(BAND_ORDER)}
 
 # Valid regions
 VALID_REGIONS = ["eu", "na", "sa", "as", "oc", "af"]
@@ -99,10 +106,7 @@ def get_available_bands(data: dict) -> list:
     
     # Sort by BAND_ORDER, unknown bands go to end
     def sort_key(band):
-        try:
-            return BAND_ORDER.index(band)
-        except ValueError:
-            return 999
+        return BAND_RANK.get(band, 999)
     
     return sorted(available, key=sort_key)
 
@@ -125,21 +129,183 @@ SYMBOLS_ASCII = {
     "VeryPoor": "[    ]",
 }
 
+# Rating rank for --alert comparisons (higher is better)
+RATING_RANK = {"VeryPoor": 0, "Poor": 1, "Fair": 2, "Good": 3, "Excellent": 4}
+
+
+def detect_ascii() -> bool:
+    """
+    True if DX_ASCII is set to a true value (anything but empty, 0, false,
+    no or off) or stdout cannot encode the emoji symbols.
+    ASCII mode replaces the emoji and arrows but keeps the ═/─ box-drawing
+    lines, which cp437/cp850 consoles can show but e.g. pure ASCII can't.
+    """
+    if os.environ.get("DX_ASCII", "").strip().lower() not in ("", "0", "false", "no", "off"):
+        return True
+    try:
+        "".join(SYMBOLS.values()).encode(getattr(sys.stdout, "encoding", None) or "ascii")
+    except (UnicodeEncodeError, LookupError):
+        return True
+    return False
+
+
+# Default for --ascii, checked once at startup
+ASCII_DEFAULT = detect_ascii()
+
+
+# Fastest available JSON library: orjson, then ujson, then the stdlib.
+# Resolved on first use by json_backend().
+_json_backend = None
+
+
+def json_backend():
+    """Return the JSON module to use (orjson, ujson or json)"""
+    global _json_backend
+    if _json_backend is None:
+        try:
+            import orjson as _json_backend
+        except ImportError:
+            try:
+                import ujson as _json_backend
+            except ImportError:
+                import json as _json_backend
+    return _json_backend
+
+
+def load_json(raw: bytes):
+    """
+    Parse a JSON response body.
+    Raises ValueError on invalid JSON (each library's JSONDecodeError
+    is a ValueError subclass).
+    """
+    # All three accept the raw bytes, no separate decode to str needed
+    return json_backend().loads(raw)
+
+
+def dumps_json(payload) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes indented by 2. The layout matches
+    json.dumps(payload, indent=2), but details follow the backend: orjson
+    writes non-ASCII characters as-is instead of \\u escapes and may format
+    floats differently. Written to stdout's binary buffer by write_output().
+    """
+    backend = json_backend()
+    if backend.__name__ == "orjson":
+        return backend.dumps(payload, option=backend.OPT_INDENT_2)
+    if backend.__name__ == "ujson":
+        return backend.dumps(payload, indent=2, escape_forward_slashes=False).encode('utf-8')
+    return backend.dumps(payload, indent=2).encode('utf-8')
+
 
 def fetch_data(url: str = API_URL) -> dict:
     """Fetch current conditions from public API"""
+    return parse_data(fetch_data_bytes(url))
+
+
+def fetch_data_bytes(url: str = API_URL) -> bytes:
+    """Fetch current conditions as the raw (unparsed) response body"""
+    import urllib.request
+    import urllib.error
     try:
         req = urllib.request.Request(url, headers={'User-Agent': 'DXIndex/2.1'})
         with urllib.request.urlopen(req, timeout=10) as response:
-            return json.loads(response.read().decode('utf-8'))
+            return response.read()
     except urllib.error.URLError as e:
         print(f"Error: Cannot reach API - {e.reason}", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+
+
+def parse_data(body: bytes) -> dict:
+    """Parse an API response body, exit with an error if it is not JSON"""
+    try:
+        return load_json(body)
+    except ValueError as e:
         print(f"Error: Invalid API response - {e}", file=sys.stderr)
         sys.exit(1)
 
 
+# Connection kept open between --watch refreshes (None = not connected)
+_watch_conn = None
+
+# Last --watch response, revalidated with If-None-Match/If-Modified-Since.
+# Every refresh still asks the server, so the data shown is never more than
+# one --interval old; a 304 just saves the download and the JSON parse.
+_watch_cache = {}
+
+
+def fetch_data_bytes_keepalive(url: str = API_URL) -> bytes:
+    """
+    Like fetch_data_bytes(), but over a persistent HTTP(S) connection.
+    Used by --watch to skip the TCP/TLS handshake on every refresh;
+    the connection is re-opened once if the server has dropped it.
+    Unchanged data (304 Not Modified) is served from _watch_cache.
+    """
+    global _watch_conn
+    import http.client
+    import urllib.parse
+    import urllib.request
+    
+    parts = urllib.parse.urlsplit(url)
+    # Leave proxies and anything unusual to urllib
+    if parts.scheme not in ("http", "https") or urllib.request.getproxies().get(parts.scheme):
+        return fetch_data_bytes(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    
+    headers = {'User-Agent': 'DXIndex/2.1', 'Connection': 'keep-alive'}
+    if _watch_cache.get("etag"):
+        headers['If-None-Match'] = _watch_cache["etag"]
+    if _watch_cache.get("last_modified"):
+        headers['If-Modified-Since'] = _watch_cache["last_modified"]
+    
+    for attempt in (1, 2):
+        if _watch_conn is None:
+            if parts.scheme == "https":
+                _watch_conn = http.client.HTTPSConnection(parts.netloc, timeout=10)
+            else:
+                _watch_conn = http.client.HTTPConnection(parts.netloc, timeout=10)
+        try:
+            _watch_conn.request("GET", path, headers=headers)
+            response = _watch_conn.getresponse()
+            body = response.read()
+            break
+        except (http.client.HTTPException, OSError) as e:
+            _watch_conn.close()
+            _watch_conn = None
+            if attempt == 2:
+                print(f"Error: Cannot reach API - {e}", file=sys.stderr)
+                sys.exit(1)
+    
+    if response.will_close:
+        _watch_conn.close()
+        _watch_conn = None
+    
+    if response.status == 304 and "body" in _watch_cache:
+        return _watch_cache["body"]
+    if response.status in (301, 302, 303, 307, 308):
+        # Let urllib follow redirects
+        return fetch_data_bytes(url)
+    if response.status >= 400:
+        print(f"Error: Cannot reach API - {response.reason}", file=sys.stderr)
+        sys.exit(1)
+    
+    _watch_cache.clear()
+    _watch_cache["etag"] = response.getheader("ETag")
+    _watch_cache["last_modified"] = response.getheader("Last-Modified")
+    _watch_cache["body"] = body
+    return body
+
+
+def parse_data_keepalive(body: bytes) -> dict:
+    """Like parse_data(), but parses the cached --watch body only once"""
+    if body is not _watch_cache.get("body"):
+        return parse_data(body)
+    if "data" not in _watch_cache:
+        _watch_cache["data"] = parse_data(body)
+    return _watch_cache["data"]
+
+
 def fetch_regional_v4_data(region: str) -> dict:
     """
     Fetch full regional data from dxmap v4.json.
@@ -153,11 +319,12 @@ def fetch_regional_v4_data(region: str) -> dict:
         }
     }
     """
+    import urllib.request
     url = f"{DXMAP_URL}/{region.lower()}_v4.json"
     try:
         req = urllib.request.Request(url, headers={'User-Agent': 'DXIndex/2.2'})
         with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
+            data = load_json(response.read())
             return aggregate_v4_by_corridor(data, region)
     except:
         return {'corridors': {}}
@@ -265,54 +432,71 @@ def ssb_to_rating(spots: int) -> tuple:
         return "--", "🔴"
 
 
+# Fixed parts of the format_standard() table, built once
+STANDARD_RULE = "═" * 55
+STANDARD_HEADER = f"  {'Band':<6} {'Now':<8} {'Rating':<18} {'Tomorrow':<12}"
+STANDARD_UNDERLINE = "  " + "─" * 48
+# Band row: band, index, rating (with symbol), forecast, forecast rating
+STANDARD_ROW = "  %-6s %-8.1f %-18s %.1f (%s)"
+
+
+def format_updated(updated):
+    """
+    Format the API timestamp for display by slicing the ISO string:
+    '2026-03-13T09:26:11Z' -> '2026-03-13 09:26'. Returns None if it
+    doesn't look like an ISO date and time.
+    """
+    if (isinstance(updated, str) and len(updated) >= 16
+            and updated[4] == "-" and updated[10] in "T "):
+        return f"{updated[:10]} {updated[11:16]}"
+    return None
+
+
 def format_standard(data: dict, bands: list, use_ascii: bool = False) -> str:
     """Format output for terminal display"""
     if "error" in data:
         return f"Error: {data['error']}"
     
     symbols = SYMBOLS_ASCII if use_ascii else SYMBOLS
+    # Rating with peak indicator: symbol, rating, vs_typical
+    peak_fmt = "%s %s +%s%%" if use_ascii else "%s %s ⬆+%s%%"
     
     lines = []
     lines.append("")
-    lines.append("═══════════════════════════════════════════════════════")
+    lines.append(STANDARD_RULE)
     lines.append("  HF DX INDEX - Current Conditions")
-    lines.append("═══════════════════════════════════════════════════════")
+    lines.append(STANDARD_RULE)
     
-    # Parse timestamp
-    if "updated" in data:
-        try:
-            ts = datetime.fromisoformat(data["updated"].replace("Z", "+00:00"))
-            lines.append(f"  Updated: {ts.strftime('%Y-%m-%d %H:%M')} UTC")
-        except:
-            pass
+    # Timestamp
+    updated = format_updated(data.get("updated"))
+    if updated:
+        lines.append(f"  Updated: {updated} UTC")
     lines.append("")
     
     # Header
-    lines.append(f"  {'Band':<6} {'Now':<8} {'Rating':<18} {'Tomorrow':<12}")
-    lines.append("  " + "─" * 48)
+    lines.append(STANDARD_HEADER)
+    lines.append(STANDARD_UNDERLINE)
     
     # Each band
-    band_data = data.get("bands", {})
+    band_data_get = data.get("bands", {}).get
+    symbols_get = symbols.get
     for band in bands:
-        if band in band_data:
-            d = band_data[band]
+        d = band_data_get(band)
+        if d is not None:
             idx = d.get("index", 0)
             rating = d.get("rating", "?")
-            symbol = symbols.get(rating, "?")
+            symbol = symbols_get(rating, "?")
             fcst = d.get("forecast", 0)
             fcst_rating = d.get("forecast_rating", "?")
             
             # Add peak indicator if significant (>20% above typical)
             vs_typical = d.get("vs_typical")
             if vs_typical and vs_typical > 20:
-                if use_ascii:
-                    rating_str = f"{symbol} {rating} +{vs_typical}%"
-                else:
-                    rating_str = f"{symbol} {rating} ⬆+{vs_typical}%"
+                rating_str = peak_fmt % (symbol, rating, vs_typical)
             else:
                 rating_str = f"{symbol} {rating}"
             
-            lines.append(f"  {band:<6} {idx:<8.1f} {rating_str:<18} {fcst:.1f} ({fcst_rating})")
+            lines.append(STANDARD_ROW % (band, idx, rating_str, fcst, fcst_rating))
     
     lines.append("")
     
@@ -332,9 +516,12 @@ def format_standard(data: dict, bands: list, use_ascii: bool = False) -> str:
             else:
                 lines.append(f"  ⚠️  Storm: {prob:.0f}% probability → Kp {kp:.0f}")
         elif prob >= 30:
-            lines.append(f"  Storm: {prob:.0f}% probability → Kp {kp:.0f}")
+            if use_ascii:
+                lines.append(f"  Storm: {prob:.0f}% probability -> Kp {kp:.0f}")
+            else:
+                lines.append(f"  Storm: {prob:.0f}% probability → Kp {kp:.0f}")
     
-    lines.append("═══════════════════════════════════════════════════════")
+    lines.append(STANDARD_RULE)
     source = data.get("source", "wspr.hb9vqq.ch")
     # Strip protocol for display
     if source.startswith("https://"):
@@ -413,18 +600,18 @@ def format_regional(data: dict, region: str, use_ascii: bool = False) -> str:
     lines.append("═══════════════════════════════════════════════════════════════════")
     
     # Get timestamp from global data
-    if "updated" in data:
-        try:
-            ts = datetime.fromisoformat(data["updated"].replace("Z", "+00:00"))
-            lines.append(f"  Updated: {ts.strftime('%Y-%m-%d %H:%M')} UTC")
-        except:
-            pass
+    updated = format_updated(data.get("updated"))
+    if updated:
+        lines.append(f"  Updated: {updated} UTC")
     lines.append("")
     
     # Header - Digi = best band:index, SSB = best band:rating
     lines.append(f"  {'Corridor':<12} {'Digi':<14} {'SSB':<16}")
     lines.append("  " + "─" * 44)
     
+    # SSB column for corridors without spots
+    ssb_none = "--" if use_ascii else "🔴 --"
+    
     # Each corridor (already sorted by best_digi_index)
     for corridor, cdata in corridors.items():
         digi_band = cdata.get("best_digi_band", "?")
@@ -443,11 +630,10 @@ def format_regional(data: dict, region: str, use_ascii: bool = False) -> str:
             else:
                 ssb_str = f"{ssb_symbol} {ssb_band}:{ssb_rating}"
         else:
-            if use_ascii:
-                ssb_str = "--"
-            else:
-                ssb_str = "🔴 --"
+            ssb_str = ssb_none
         
+        if use_ascii:
+            corridor = corridor.replace("↔", "<->")
         lines.append(f"  {corridor:<12} {digi_str:<14} {ssb_str}")
     
     lines.append("")
@@ -464,29 +650,31 @@ def format_regional(data: dict, region: str, use_ascii: bool = False) -> str:
     return "\n".join(lines)
 
 
-def format_compact(data: dict, bands: list) -> str:
+def format_compact(data: dict, bands: list, use_ascii: bool = False) -> str:
     """One-line compact format"""
     if "error" in data:
         return f"Error: {data['error']}"
     
+    # Peak indicator before the vs_typical percentage
+    peak = "+" if use_ascii else "⬆"
     parts = []
-    band_data = data.get("bands", {})
+    band_data_get = data.get("bands", {}).get
     for band in bands:
-        if band in band_data:
-            d = band_data[band]
+        d = band_data_get(band)
+        if d is not None:
             idx = d.get("index", 0)
             rating = d.get("rating", "?")
             vs_typical = d.get("vs_typical")
             
             if vs_typical and vs_typical > 20:
-                parts.append(f"{band}:{rating}({idx:.0f})⬆{vs_typical}%")
+                parts.append(f"{band}:{rating}({idx:.0f}){peak}{vs_typical}%")
             else:
                 parts.append(f"{band}:{rating}({idx:.0f})")
     
     return " | ".join(parts)
 
 
-def format_compact_regional(data: dict, region: str) -> str:
+def format_compact_regional(data: dict, region: str, use_ascii: bool = False) -> str:
     """One-line compact format for regional data using v4 data"""
     # Fetch v4 data from dxmap
     v4_data = fetch_regional_v4_data(region)
@@ -501,6 +689,8 @@ def format_compact_regional(data: dict, region: str) -> str:
         digi_index = cdata.get("best_digi_index", 0)
         ssb_band = cdata.get("best_ssb_band")
         ssb_spots = cdata.get("best_ssb_spots", 0)
+        if use_ascii:
+            corridor = corridor.replace("↔", "<->")
         
         if ssb_spots > 0 and ssb_band:
             ssb_rating, _ = ssb_to_rating(ssb_spots)
@@ -511,12 +701,27 @@ def format_compact_regional(data: dict, region: str) -> str:
     return " | ".join(parts)
 
 
-def format_json(data: dict, bands: list) -> str:
-    """JSON output for scripting"""
-    available = get_available_bands(data)
-    
+def raw_json_output(raw: bytes):
+    """
+    Return a response body as --json output unchanged if it starts like
+    dumps_json() output (an object whose first key is on its own line,
+    indented by 2), otherwise None (serialize instead). Only the start is
+    checked: the rest of the body is passed on as the API wrote it.
+    """
+    if raw.startswith(b'{\n  "'):
+        return raw
+    return None
+
+
+def format_json(data: dict, bands: list, raw: bytes = None) -> bytes:
+    """
+    JSON output for scripting.
+    raw is the response body data was parsed from; when no bands are
+    filtered out and it starts like dumps_json() output (see
+    raw_json_output()), it is returned as-is instead of being serialized.
+    """
     # Filter to requested bands if subset specified
-    if set(bands) != set(available):
+    if set(bands) != data.get("bands", {}).keys():
         filtered = {
             "updated": data.get("updated"),
             "bands": {b: data.get("bands", {}).get(b) for b in bands if b in data.get("bands", {})},
@@ -524,12 +729,16 @@ def format_json(data: dict, bands: list) -> str:
         }
         if "storm" in data:
             filtered["storm"] = data["storm"]
-        return json.dumps(filtered, indent=2)
+        return dumps_json(filtered)
     
-    return json.dumps(data, indent=2)
+    if raw is not None:
+        output = raw_json_output(raw)
+        if output is not None:
+            return output
+    return dumps_json(data)
 
 
-def format_json_regional(data: dict, region: str) -> str:
+def format_json_regional(data: dict, region: str) -> bytes:
     """JSON output for regional data"""
     region_upper = region.upper()
     regions_data = data.get("regions", {})
@@ -543,37 +752,31 @@ def format_json_regional(data: dict, region: str) -> str:
     if "storm" in data:
         filtered["storm"] = data["storm"]
     
-    return json.dumps(filtered, indent=2)
+    return dumps_json(filtered)
 
 
 def check_alert(data: dict, bands: list, min_rating: str) -> bool:
     """Check if any band meets minimum rating threshold"""
-    rating_order = ["VeryPoor", "Poor", "Fair", "Good", "Excellent"]
-    
-    if min_rating not in rating_order:
+    min_level = RATING_RANK.get(min_rating)
+    if min_level is None:
         return False
     
-    min_level = rating_order.index(min_rating)
-    
-    band_data = data.get("bands", {})
+    band_data_get = data.get("bands", {}).get
+    rank_get = RATING_RANK.get
     for band in bands:
-        if band in band_data:
-            rating = band_data[band].get("rating", "VeryPoor")
-            if rating in rating_order:
-                if rating_order.index(rating) >= min_level:
-                    return True
+        d = band_data_get(band)
+        if d is not None and rank_get(d.get("rating", "VeryPoor"), -1) >= min_level:
+            return True
     
     return False
 
 
 def check_alert_regional(data: dict, region: str, min_rating: str) -> bool:
     """Check if any corridor in region meets minimum rating threshold"""
-    rating_order = ["VeryPoor", "Poor", "Fair", "Good", "Excellent"]
-    
-    if min_rating not in rating_order:
+    min_level = RATING_RANK.get(min_rating)
+    if min_level is None:
         return False
     
-    min_level = rating_order.index(min_rating)
     region_upper = region.upper()
     
     regions_data = data.get("regions", {})
@@ -584,14 +787,66 @@ def check_alert_regional(data: dict, region: str, min_rating: str) -> bool:
     for corridor, info in corridors.items():
         spots_per_tx = info.get("spots_per_tx", 0)
         rating, _ = activity_to_rating(spots_per_tx)
-        if rating in rating_order:
-            if rating_order.index(rating) >= min_level:
-                return True
+        if RATING_RANK.get(rating, -1) >= min_level:
+            return True
     
     return False
 
 
-def main():
+# Options understood by parse_args_fast(), mapped to their argparse dest
+FAST_FLAGS = {"--json": "json", "--compact": "compact", "--ascii": "ascii", "--watch": "watch"}
+FAST_OPTIONS = {
+    "--region": ("region", str),
+    "-r": ("region", str),
+    "--interval": ("interval", int),
+    "--alert": ("alert", str),
+    "--url": ("url", str),
+}
+
+
+def parse_args_fast(argv: list):
+    """
+    Parse common command lines without building the argparse parser.
+    Returns None for anything else (-h, -v, unknown or abbreviated flags,
+    missing/invalid values) so main() falls back to argparse, which then
+    produces the usual help, version and error output.
+    """
+    args = types.SimpleNamespace(bands=[], region=None, json=False, compact=False,
+                                 ascii=False, watch=False, interval=60, alert=None,
+                                 url=API_URL)
+    # argparse only accepts the bands as one contiguous group
+    bands_closed = False
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if not token.startswith("-"):
+            if bands_closed:
+                return None
+            args.bands.append(token)
+        else:
+            if args.bands:
+                bands_closed = True
+            if token in FAST_FLAGS:
+                setattr(args, FAST_FLAGS[token], True)
+            elif token in FAST_OPTIONS:
+                i += 1
+                if i == len(argv) or argv[i].startswith("-"):
+                    return None
+                dest, convert = FAST_OPTIONS[token]
+                try:
+                    setattr(args, dest, convert(argv[i]))
+                except ValueError:
+                    return None
+            else:
+                return None
+        i += 1
+    return args
+
+
+def build_parser():
+    """Full argparse parser, used for help, version and error reporting"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="DX Index CLI - Quick HF propagation check",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -619,15 +874,50 @@ Data source: https://tinyurl.com/HFDXProp
                        help="Show regional DX conditions (eu, na, sa, as, oc, af)")
     parser.add_argument("--json", action="store_true", help="JSON output")
     parser.add_argument("--compact", action="store_true", help="One-line compact output")
-    parser.add_argument("--ascii", action="store_true", help="ASCII symbols (no emoji)")
+    parser.add_argument("--ascii", action="store_true",
+                       help="ASCII symbols (no emoji, default if the terminal can't show them or DX_ASCII=1)")
     parser.add_argument("--watch", action="store_true", help="Auto-refresh every 60s")
     parser.add_argument("--interval", type=int, default=60, help="Refresh interval for --watch (default: 60)")
     parser.add_argument("--alert", type=str, metavar="RATING", 
                        help="Exit 0 if any band/corridor >= RATING (VeryPoor/Poor/Fair/Good/Excellent)")
     parser.add_argument("--url", type=str, default=API_URL, 
                        help=f"API endpoint URL (default: {DEFAULT_API_URL}, or set DX_API_URL env var)")
-    
-    args = parser.parse_args()
+    return parser
+
+
+def write_output(output, prefix: str = "", suffix: str = "") -> None:
+    """
+    Write prefix, output plus a newline, and suffix to stdout in one write.
+    Text goes through stdout's encoding. JSON output is UTF-8 bytes and is
+    written to the binary buffer as-is, so it is never re-encoded and
+    can't fail on a console encoding that lacks its characters.
+    """
+    if sys.stdout is None:
+        return
+    if isinstance(output, bytes):
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            newline = b"" if output.endswith(b"\n") else b"\n"
+            sys.stdout.flush()
+            if prefix or suffix:
+                buffer.write(b"".join((prefix.encode(), output, newline, suffix.encode())))
+            else:
+                buffer.write(output)
+                buffer.write(newline)
+            buffer.flush()
+            return
+        output = output.decode('utf-8').rstrip("\n")
+    if output is None:
+        sys.stdout.write(prefix + suffix)
+    else:
+        sys.stdout.write(prefix + output + "\n" + suffix)
+    sys.stdout.flush()
+
+
+def main():
+    args = parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
     
     # Validate region if specified
     if args.region:
@@ -639,63 +929,95 @@ Data source: https://tinyurl.com/HFDXProp
     # Override API URL if specified (for testing)
     api_url = args.url
     
+    use_ascii = args.ascii or ASCII_DEFAULT
+    
     # User-requested bands (validated after fetching data)
     requested_bands = args.bands if args.bands else None
     
+    # --watch keeps one connection open across refreshes
+    if args.watch:
+        fetch, parse = fetch_data_bytes_keepalive, parse_data_keepalive
+    else:
+        fetch, parse = fetch_data_bytes, parse_data
+    
+    # Unfiltered --json can print the response without parsing it
+    json_passthrough = args.json and not (args.region or args.alert or requested_bands)
+    
     def refresh():
-        data = fetch_data(api_url)
+        """
+        Fetch and render once, returns (alert result, output or None).
+        Output is text, or bytes for --json (see write_output()).
+        """
+        raw = fetch(api_url)
+        if json_passthrough:
+            output = raw_json_output(raw)
+            if output is not None:
+                return None, output
+        data = parse(raw)
         
         # Regional mode
         if args.region:
             if args.alert:
-                return check_alert_regional(data, args.region, args.alert)
+                return check_alert_regional(data, args.region, args.alert), None
             
             if args.json:
-                print(format_json_regional(data, args.region))
+                return None, format_json_regional(data, args.region)
             elif args.compact:
-                print(format_compact_regional(data, args.region))
+                return None, format_compact_regional(data, args.region, use_ascii=use_ascii)
             else:
-                print(format_regional(data, args.region, use_ascii=args.ascii))
-            
-            return None
+                return None, format_regional(data, args.region, use_ascii=use_ascii)
         
         # Global mode (original behavior)
-        available = get_available_bands(data)
-        
-        # Determine which bands to show
+        # Determine which bands to show, in one pass over the requested
+        # bands; the sorted list of all bands is only built when needed
         if requested_bands:
-            bands = [b for b in requested_bands if b in available]
+            band_data = data.get("bands", {})
+            bands = [b for b in requested_bands if b in band_data]
             if not bands:
+                available = get_available_bands(data)
                 print(f"Error: No valid bands specified. Available: {', '.join(available)}", file=sys.stderr)
                 sys.exit(1)
         else:
-            bands = available
+            bands = get_available_bands(data)
         
         if args.alert:
-            return check_alert(data, bands, args.alert)
+            return check_alert(data, bands, args.alert), None
         
         if args.json:
-            print(format_json(data, bands))
+            return None, format_json(data, bands, raw)
         elif args.compact:
-            print(format_compact(data, bands))
+            return None, format_compact(data, bands, use_ascii=use_ascii)
         else:
-            print(format_standard(data, bands, use_ascii=args.ascii))
-        
-        return None
+            return None, format_standard(data, bands, use_ascii=use_ascii)
     
     if args.watch:
+        if args.interval < 0:
+            print("Error: --interval must not be negative", file=sys.stderr)
+            sys.exit(1)
+        footer = f"[Auto-refresh every {args.interval}s - Ctrl+C to exit]\n"
+        # Refresh on a fixed monotonic schedule, so the time spent fetching
+        # doesn't add up to drift over long sessions
+        next_tick = time.monotonic()
         try:
             while True:
-                # Clear screen
-                print("\033[2J\033[H", end="")
-                refresh()
-                print(f"[Auto-refresh every {args.interval}s - Ctrl+C to exit]")
-                time.sleep(args.interval)
+                _, output = refresh()
+                # Clear screen, output and footer in a single write per frame
+                write_output(output, prefix="\033[2J\033[H", suffix=footer)
+                next_tick += args.interval
+                delay = next_tick - time.monotonic()
+                if delay < 0 and args.interval > 0:
+                    # Refresh took longer than the interval: wait for the
+                    # next tick instead of firing the missed ones back to back
+                    delay %= args.interval
+                    next_tick = time.monotonic() + delay
+                time.sleep(max(0, delay))
         except KeyboardInterrupt:
             print("\nExiting...")
             sys.exit(0)
     else:
-        result = refresh()
+        result, output = refresh()
+        if output is not None:
+            write_output(output)
         if args.alert:
             sys.exit(0 if result else 1)
 